@@ -1,22 +1,31 @@
 #!/usr/bin/env python3
 """Simplifies `xterm` color usage and management.
 """
+##############################################################################
+# VERSION
+
+__version__ = "0.1.0"
+
 ##############################################################################
 # IMPORTS
 
-from .__meta__ import __version__
-from .__source__ import (
-  Color, Spectrum,
-  # ...
-  Bit8, DegUnit, Percent,
-  # ...
-  HueName, HueLevel, SatLevel,
-  # ...
-  Red, Orange, Yellow, Lime,
-  Green, Turquoise, Teal, Cyan,
-  Blue, Purple, Magenta, Rose,
-  Grey, White, Black,
-)
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+  from .__source__ import (
+    Color, Spectrum,
+    # ...
+    Bit8, DegUnit, Percent,
+    # ...
+    HueName, HueLevel, SatLevel,
+    # ...
+    Red, Orange, Yellow, Lime,
+    Green, Turquoise, Teal, Cyan,
+    Blue, Purple, Magenta, Rose,
+    Grey, White, Black,
+    # ...
+    rgb_to_xterm256,
+  )
 
 __all__ = [
   # ...
@@ -47,7 +56,24 @@ __all__ = [
   # ...
   'Spectrum',
   # ...
+  'rgb_to_xterm256',
+  # ...
   '__version__',
 ]
 
 ##############################################################################
+# LAZY LOADING
+
+def __getattr__(name: str):
+  # Defer building the palette until a name is actually referenced.
+  if name not in __all__:
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+  from . import __source__
+  value = getattr(__source__, name)
+  globals()[name] = value
+  return value
+
+def __dir__():
+  return sorted({*globals(), *__all__})
+
+##############################################################################
@@ -12,17 +12,27 @@ def test():
 ##############################################################################
 
 def main():
-  import sys
+  import os, sys
+  from argparse import ArgumentParser
+  from . import __version__
+  # ...
+  parser = ArgumentParser(prog='pyrex', description=__doc__)
+  parser.add_argument('-K', '--kaleidoscope', action='store_true', help='display a looping marquee of the spectrum')
+  parser.add_argument('--test', action='store_true', help='run the doctests first (or set PYREX_SELFTEST)')
+  parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
+  args = parser.parse_args()
+  # Run tests, when asked to
+  if args.test or os.environ.get('PYREX_SELFTEST'):
+    if test().failed:
+      sys.exit(1)
+  # Only now is the palette needed
   from . import Spectrum
-  # Run tests
-  if test().failed:
-    sys.exit(1)
   # Run the Kaleidoscope
-  if sys.argv[-1] == '-K':
+  if args.kaleidoscope:
     Spectrum.Kaleidoscope()
   # Print all colors
   else:
-    print(Spectrum)
+    sys.stdout.buffer.write(Spectrum._render_bytes() + b'\n')
   sys.exit(0)
 
 if __name__ == "__main__": main()
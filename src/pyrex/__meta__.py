@@ -1,35 +0,0 @@
-#!/usr/bin/env python3
-
-###########################################################################
-
-__prog__ = "clo"
-__title__ = "CLO (Command-Line Odoo)"
-__doc__ = (
-    f"{__title__} - Perform API operations on Odoo instances from the command-line."
-)
-__author__ = "Arian Johnson"
-__contact__ = "i.am@ajohn.dev"
-__maintainer__ = __author__
-__email__ = __contact__
-__copyright__ = "Copyright 2023, DFFRNT Innovations Inc."
-__license__ = "GPLv3"
-__status__ = "Production"
-__version__ = "0.6.0"
-
-__all__ = [
-    "__prog__",
-    "__title__",
-    "__author__",
-    "__contact__",
-    "__maintainer__",
-    "__email__",
-    "__copyright__",
-    "__license__",
-    "__status__",
-    "__version__",
-]
-
-###########################################################################
-
-if __name__ == "__main__":
-    print(f"{__title__} - {__doc__}")  # pragma: no cover
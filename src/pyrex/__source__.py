@@ -88,13 +88,11 @@ Examples:
 # IMPORTS
 
 import sys as _sys, typing as _t
-from functools import lru_cache
-from .__meta__ import __title__
+from operator import itemgetter
 
 ##############################################################################
 # GLOBALS
 
-__version__ = '0.1.0'
 __author__  = "Arian Johnson"
 __contact__ = "arian.johnson@rcgtconsulting.com"
 
@@ -182,43 +180,39 @@ class Bit8(int):
     except:
       raise ValueError(f'Bit8 value must be convertible to int (got {repr(value)})')
 
-  @lru_cache
+  @classmethod
+  def _raw(cls, value: int) -> 'Bit8':
+    # Skips validation, for values already known to be within range.
+    return int.__new__(cls, value)
+
   def __invert__(self) -> int:
-    return Bit8(self._ - int(self))
+    return Bit8._raw(self._ - int(self))
 
-  @lru_cache
   def __add__(self, other: int):
-    result = int(super().__add__(other))
-    return Bit8(self._ if result > self._ else result)
+    R = int.__add__(self, other)
+    return Bit8._raw(self._ if R > self._ else 0 if R < 0 else R)
 
-  @lru_cache
   def __radd__(self, other: int):
     return self.__add__(other)
 
-  @lru_cache
   def __sub__(self, other: int):
-    result = int(super().__sub__(other))
-    return Bit8(0 if result < 0 else result)
+    R = int.__sub__(self, other)
+    return Bit8._raw(0 if R < 0 else self._ if R > self._ else R)
 
-  @lru_cache
   def __rsub__(self, other: int):
     return self.__sub__(other)
 
-  @lru_cache
   def __mul__(self, other: int):
-    result = int(super().__mul__(other))
-    return Bit8(self._ if result > self._ else result)
+    R = int.__mul__(self, other)
+    return Bit8._raw(self._ if R > self._ else 0 if R < 0 else R)
 
-  @lru_cache
   def __rmul__(self, other: int):
     return self.__mul__(other)
 
-  @lru_cache
   def __truediv__(self, other: int):
-    result = int(super().__truediv__(other))
-    return Bit8(0 if result < 0 else result)
+    R = int(int.__truediv__(self, other))
+    return Bit8._raw(0 if R < 0 else self._ if R > self._ else R)
 
-  @lru_cache
   def __rtruediv__(self, other: int):
     return self.__truediv__(other)
 
@@ -236,7 +230,6 @@ class DegUnit(int):
 
   _: _t.ClassVar[int] = 360
 
-  @lru_cache
   def __new__(cls, value: str | int = 0):
     """
       Args:
@@ -255,25 +248,25 @@ class DegUnit(int):
     except:
       raise ValueError('Degree value must be convertible to int')
 
-  @lru_cache
+  @classmethod
+  def _raw(cls, value: int) -> 'DegUnit':
+    # Skips validation, for values already known to be within range.
+    return int.__new__(cls, value)
+
   def __str__(self) -> str:
     return f'{repr(self)}°'
 
-  @lru_cache
   def __add__(self, other: int):
     result = super().__add__(other)
     return result % self._ if result > self._ else result
 
-  @lru_cache
   def __radd__(self, other: int):
     return self.__add__(other)
 
-  @lru_cache
   def __sub__(self, other: int):
     result = super().__sub__(other)
     return result % self._ if result < 0 else result
 
-  @lru_cache
   def __rsub__(self, other: int):
     return self.__sub__(other)
 
@@ -291,7 +284,6 @@ class Percent(float):
 
   __slots__ = ()
 
-  @lru_cache
   def __new__(cls, value: str | int | float):
     """
       Args:
@@ -309,11 +301,14 @@ class Percent(float):
     except ValueError:
       raise ValueError('Percent value must be convertible to float')
 
-  @lru_cache
+  @classmethod
+  def _raw(cls, value: float) -> 'Percent':
+    # Skips validation, for values already known to be within range.
+    return float.__new__(cls, value)
+
   def __invert__(self) -> float:
     return self * 100.0
 
-  @lru_cache
   def __str__(self) -> str:
     return f'{~self:.1F}%'
 
@@ -363,31 +358,37 @@ class Color:
       >>> clr *= 2
       >>> print(f'{clr:hello, world}')
       \033[38;5;168mhello, world\033[0m
+
+      Shifts wrap around the color wheel, however far they go:
+      >>> (Color(202) << 1).ANSI
+      196
+      >>> (Color(196) >> 13).ANSI
+      202
+
+      Greys sit just before the first hue, alongside `Red`:
+      >>> (Color(102) >> 0).ANSI
+      95
+      >>> (Color(102) >> 1).ANSI
+      94
+
+      Negative amounts work in the opposite direction:
+      >>> (Color(196) + -2).ANSI
+      124
+      >>> Color(196) + -2 == Color(196) - 2
+      True
   """
 
+  __slots__ = ('_ansi', '_bg')
+
   class RGBModel(tuple[Bit8, Bit8, Bit8]):
     """Represents an RGB color model.
     """
 
     __slots__ = ()
 
-    @property
-    @lru_cache
-    def R(self) -> Bit8:
-      """The the amount of red (`0-255`) in the color."""
-      return self[0]
-
-    @property
-    @lru_cache
-    def G(self) -> Bit8:
-      """The the amount of green (`0-255`) in the color."""
-      return self[1]
-
-    @property
-    @lru_cache
-    def B(self) -> Bit8:
-      """The the amount of blue (`0-255`) in the color."""
-      return self[2]
+    R = property(itemgetter(0), doc="The the amount of red (`0-255`) in the color.")
+    G = property(itemgetter(1), doc="The the amount of green (`0-255`) in the color.")
+    B = property(itemgetter(2), doc="The the amount of blue (`0-255`) in the color.")
 
     def __new__(cls, R: Bit8 = 0, G: Bit8 = 0, B: Bit8 = 0):
       """
@@ -398,6 +399,11 @@ class Color:
       """
       return super().__new__(cls, (Bit8(R), Bit8(G), Bit8(B)))
 
+    @classmethod
+    def _raw(cls, R: int, G: int, B: int) -> 'Color.RGBModel':
+      # Skips validation, for values already known to be within range.
+      return tuple.__new__(cls, (Bit8._raw(R), Bit8._raw(G), Bit8._raw(B)))
+
     def __getnewargs__(self) -> _t.Tuple[Bit8, Bit8, Bit8]:
       return self
 
@@ -417,23 +423,9 @@ class Color:
 
     __slots__ = ()
 
-    @property
-    @lru_cache
-    def H(self) -> DegUnit:
-      """The point in which the color's hue falls on the color wheel (`0°-360°`)."""
-      return self[0]
-
-    @property
-    @lru_cache
-    def S(self) -> Percent:
-      """The percentage of saturation (intensity/vividness) the color has."""
-      return self[1]
-
-    @property
-    @lru_cache
-    def V(self) -> Bit8:
-      """The maximum brightness (`0-255`) the color has."""
-      return self[2]
+    H = property(itemgetter(0), doc="The point in which the color's hue falls on the color wheel (`0°-360°`).")
+    S = property(itemgetter(1), doc="The percentage of saturation (intensity/vividness) the color has.")
+    V = property(itemgetter(2), doc="The maximum brightness (`0-255`) the color has.")
 
     def __new__(cls, H: DegUnit = 0, S: Percent = 0, V: Bit8 = 0):
       """
@@ -444,6 +436,11 @@ class Color:
       """
       return super().__new__(cls, (DegUnit(H), Percent(S), Bit8(V)))
 
+    @classmethod
+    def _raw(cls, H: int, S: float, V: int) -> 'Color.HSVModel':
+      # Skips validation, for values already known to be within range.
+      return tuple.__new__(cls, (DegUnit._raw(H), Percent._raw(S), Bit8._raw(V)))
+
     def __getnewargs__(self) -> _t.Tuple[DegUnit, Percent, Bit8]:
       return self
 
@@ -467,25 +464,25 @@ class Color:
   @property
   def RGB(self) -> RGBModel:
     """The red-green-blue values as a `tuple`."""
-    return self._rgb
+    return _RGB_MODELS[self._ansi]
 
   @property
   def HSV(self) -> HSVModel:
     """The hue-saturation-brightness values as a `tuple`."""
-    return self._hsv
+    return _HSV_MODELS[self._ansi]
 
   @property
   def Hue(self) -> str:
     """The name of the hue the color belongs to."""
-    return _NAMES[self.HSV.H]
+    return _HUE_NAMES[_H[self._ansi] // 30]
 
   @property
   def Background(self) -> bool:
     """Marks the color for background coloring purposes."""
-    return getattr(self,'_bg')
+    return self._bg
   @Background.setter
   def Background(self, value: bool):
-    setattr(self, '_bg', bool(value))
+    self._bg = bool(value)
 
   #################################################
 
@@ -511,75 +508,52 @@ class Color:
   def __init__(self, value):
     # ...
     if isinstance(value, self.__class__):
-      setattr(self, '_ansi', value.ANSI)
-      setattr(self,  '_rgb', value.RGB)
-      setattr(self,  '_hsv', value.HSV)
-      setattr(self,   '_bg', value.Background)
+      self._ansi = value._ansi
+      self._bg   = value._bg
       return
-    # ...
-    r,g,b = 0, 0, 0
-    ansi  = Bit8(value)
-    # ...
-    if ansi < 0 or ansi > 255:
-      raise ValueError(f"ANSI value is invalid; must be 0-255. Got {ansi}")
-    # ...
-    elif ansi < 16:
-      r,g,b = [
-        (  0,   0,   0),
-        (128,   0,   0),
-        (  0, 128,   0),
-        (128, 128,   0),
-        (  0,   0, 128),
-        (128,   0, 128),
-        (  0, 128, 128),
-        (192, 192, 192),
-        (128, 128, 128),
-        (255,   0,   0),
-        (  0, 255,   0),
-        (255, 255,   0),
-        (  0,   0, 255),
-        (255,   0, 255),
-        (  0, 255, 255),
-        (255, 255, 255),
-      ][ansi]
-    # ...
-    elif ansi > 231:
-      s = (ansi - 232) * 10 + 8
-      r,g,b = s,s,s
-    # ...
+    # The color models are shared, and looked up by ANSI code.
+    if isinstance(value, int) and 0 <= value <= 255:
+      ansi = _ANSI_CODES[value]
     else:
-      n = ansi - 16
-      # ...
-      b = n % 6
-      g = (n - b) / 6 % 6
-      r = (n - b - g * 6) / 36 % 6
-      # ...
-      r, g, b = [
-        int(v * 40 + 55 if v else 0)
-        for v in (r, g, b)
-      ]
-    # ...
-    import colorsys
-    # ...
-    shade = r == g == b
-    base  = 30
-    h,s,v = colorsys.rgb_to_hsv(r, g, b)
-    h     = base * int(round((360 * h) / base))
-    h     = 30 if h > 360 else h
-    h     = 360 if not shade and not h else h
-    # ...
-    rgb = Color.RGBModel(r,g,b)
-    hsv = Color.HSVModel(h,s,v)
-    # ...
-    setattr(self, '_ansi', ansi)
-    setattr(self,  '_rgb', rgb)
-    setattr(self,  '_hsv', hsv)
-    setattr(self,   '_bg', False)
+      ansi = Bit8(value)
+    self._ansi = ansi
+    self._bg   = False
+
+  @classmethod
+  def Nearest(cls, r: int, g: int, b: int) -> 'Color':
+    """Find the color perceptually closest to a true-color value, by its distance (_ΔE_) in the CIELAB color space.
+
+      Examples:
+        >>> Color.Nearest(250, 10, 10).ANSI
+        196
+        >>> Color.Nearest(120, 120, 125).ANSI
+        243
+
+      Args:
+        r (int): The amount of red (`0-255`).
+        g (int): The amount of green (`0-255`).
+        b (int): The amount of blue (`0-255`).
+
+      Returns:
+        Color: The nearest color, excluding the 16 system colors.
+    """
+    L, A, B = _rgb_to_lab(int(Bit8(r)), int(Bit8(g)), int(Bit8(b)))
+    ansi = min(range(16, 256), key=lambda i: (
+      (L - _XTERM_LAB[i][0]) ** 2 +
+      (A - _XTERM_LAB[i][1]) ** 2 +
+      (B - _XTERM_LAB[i][2]) ** 2
+    ))
+    return cls(ansi)
 
   def __point__(self) -> _t.Tuple[HueLevel, int]:
-    H, V = self.HSV.H, self.HSV.V
-    A = _SPECTRUM[H][V]
-    return (_LEVELS[V], A.index(self))
+    return _POINTS[self._ansi]
+
+  def __copy__(self) -> 'Color':
+    # Skips `__init__`'s dispatch; a color is just its two slots.
+    color = Color.__new__(Color)
+    color._ansi = self._ansi
+    color._bg   = self._bg
+    return color
 
   #################################################
 
@@ -587,72 +561,74 @@ class Color:
     ansi, rgb, hsv = self.ANSI, self.RGB, self.HSV
     return f'{self:{ansi:>3} | {rgb} | {hsv}}'
 
-  def __format__(self, __format_spec: str) -> str:
-    text = str(__format_spec)
-    ansi = self.ANSI
-    modi = 48 if self.Background else 38
-    return f'\033[{modi};5;{ansi}m{text}\033[0m'
-
-  def __getstate__(self):
-    return self.__dict__.copy()
+  def __bytes__(self) -> bytes:
+    # Each color only ever renders one way, so encode it once.
+    cache = _BG_BYTES if self._bg else _FG_BYTES
+    rendered = cache[self._ansi]
+    if rendered is None:
+      rendered = cache[self._ansi] = str(self).encode()
+    return rendered
 
-  def __setstate__(self, dict):
-    self.__dict__.update(dict)
+  def __format__(self, __format_spec: str) -> str:
+    prefix = _BG_PREFIX if self._bg else _FG_PREFIX
+    return prefix[self._ansi] + __format_spec + _RESET
 
   #################################################
 
   def __hash__(self):
-    return hash((self.ANSI, self.RGB, self.HSV, self.Background))
+    return (_BG_HASHES if self._bg else _FG_HASHES)[self._ansi]
 
   def __eq__(self, __o: object) -> bool:
+    # Everything else about a color derives from its ANSI code.
     if isinstance(__o, Color):
-      return self.__hash__() == __o.__hash__()
-    else:
-      return __o.__eq__(self)
+      return self._ansi == __o._ansi and self._bg == __o._bg
+    return NotImplemented
 
   def __ne__(self, __o: object) -> bool:
-    return not self.__eq__(__o)
+    if isinstance(__o, Color):
+      return self._ansi != __o._ansi or self._bg != __o._bg
+    return NotImplemented
 
   #################################################
 
   def __rshift__(self, other: int):
-    H = self.HSV.H + (Bit8(30) * other)
-    H = 30 if H == 0 else H
-    V, S = self.__point__()
-    return _SPECTRUM[H][_AMOUNTS[V]][S]
+    H = (_WHEEL_OF[self._ansi] + other) % len(_WHEEL) + 1
+    V, S = _POINTS[self._ansi]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __rrshift__(self, other: int):
     return self.__rshift__(other)
 
   def __lshift__(self, other: int):
-    H = self.HSV.H - (30 * other)
-    H = 30 if H == 0 else H
-    V, S = self.__point__()
-    return _SPECTRUM[H][_AMOUNTS[V]][S]
+    H = (_WHEEL_OF[self._ansi] - other) % len(_WHEEL) + 1
+    V, S = _POINTS[self._ansi]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __rlshift__(self, other: int):
     return self.__lshift__(other)
 
 
   def __add__(self, other: int):
-    H, (V, S) = self.HSV.H, self.__point__()
+    if other < 0:
+      return self.__sub__(-other)
+    H, (V, S) = _H[self._ansi] // 30, _POINTS[self._ansi]
     V = V + other
     V = _LVL.max if V > _LVL.max else V
-    return _SPECTRUM[H][_AMOUNTS[V]][S]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __radd__(self, other: int):
     return self.__add__(other)
 
   def __sub__(self, other: int):
-    H, (V, S) = self.HSV.H, self.__point__()
+    if other < 0:
+      return self.__add__(-other)
+    H, (V, S) = _H[self._ansi] // 30, _POINTS[self._ansi]
     V = V - other
     V = _LVL.min if V < _LVL.min else V
-    Q = _SPECTRUM[H]
-    A = _AMOUNTS[V]
-    while A not in Q and A <= 255:
+    # Not every hue reaches the darkest level.
+    while not _SPECTRUM_FLAT[H*_ROW + V]:
       V += 1
-      A = _AMOUNTS[V]
-    return Q[A][S]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __rsub__(self, other: int):
     return self.__sub__(other)
@@ -660,20 +636,20 @@ class Color:
 
   def __mul__(self, other: int):
     M = _SAT.min - 1
-    H, (V, S) = self.HSV.H, self.__point__()
+    H, (V, S) = _H[self._ansi] // 30, _POINTS[self._ansi]
     S = S - other
     S = M if S < M else S
-    return _SPECTRUM[H][_AMOUNTS[V]][S]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __rmul__(self, other: int):
     return self.__mul__(other)
 
   def __truediv__(self, other: int):
     M = _SAT.max - 1
-    H, (V, S) = self.HSV.H, self.__point__()
+    H, (V, S) = _H[self._ansi] // 30, _POINTS[self._ansi]
     S = S + other
     S = M if S > M else S
-    return _SPECTRUM[H][_AMOUNTS[V]][S]
+    return _SPECTRUM_FLAT[H*_ROW + V][S]
 
   def __rtruediv__(self, other: int):
     return self.__truediv__(other)
@@ -681,6 +657,39 @@ class Color:
 ##############################################################################
 # CONSTANTS
 
+# The RGB values of the 16 system colors (_ANSI `0-15`_).
+_SYSTEM: _t.Tuple[_t.Tuple[int, int, int], ...] = (
+  (  0,   0,   0),
+  (128,   0,   0),
+  (  0, 128,   0),
+  (128, 128,   0),
+  (  0,   0, 128),
+  (128,   0, 128),
+  (  0, 128, 128),
+  (192, 192, 192),
+  (128, 128, 128),
+  (255,   0,   0),
+  (  0, 255,   0),
+  (255, 255,   0),
+  (  0,   0, 255),
+  (255,   0, 255),
+  (  0, 255, 255),
+  (255, 255, 255),
+)
+# The linear-light intensity of each 8-bit sRGB channel value.
+_LINEAR: _t.Tuple[float, ...] = tuple(
+  c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+  for c in (i / 255 for i in range(256))
+)
+# The nearest step (`0-5`) of the color cube to each 8-bit channel value.
+_CUBE_STEPS: bytes = bytes(
+  (v > 47) + (v > 115) + (v > 155) + (v > 195) + (v > 235)
+  for v in range(256)
+)
+# The escape sequences that start & end colorization with each ANSI code.
+_FG_PREFIX: _t.Tuple[str, ...] = tuple(f'\033[38;5;{ansi}m' for ansi in range(256))
+_BG_PREFIX: _t.Tuple[str, ...] = tuple(f'\033[48;5;{ansi}m' for ansi in range(256))
+_RESET: str = '\033[0m'
 _AMOUNTS: _t.Dict[HueLevel, Bit8] = {
   0: Bit8(0),
   1: Bit8(95),
@@ -707,10 +716,132 @@ _NAMES: _t.Dict[DegUnit, HueName] = {
   DegUnit(330): 'Rose',
   DegUnit(360): 'Red',
 }
-_DEGREES: _t.Dict[HueName, DegUnit] = {
-  n: d for d,n in _NAMES.items()
-}
+# `_NAMES` & `_LEVELS` as flat tables, indexed by `degree // 30` & brightness amount.
+_HUE_NAMES: _t.Tuple[HueName, ...] = tuple(_NAMES[DegUnit(d)] for d in range(0, 361, 30))
+_LEVEL_OF: bytes = bytes(_LEVELS.get(amount, 0) for amount in range(256))
+# The twelve hues in color-wheel order (_`Grey` sits just before the first, alongside `Red`_).
+_WHEEL: _t.Tuple[DegUnit, ...] = tuple(DegUnit(d) for d in range(30, 361, 30))
 _SPECTRUM: _t.Dict[DegUnit, _t.Dict[Bit8, _t.List[Color]]] = {}
+# `_SPECTRUM` as a flat table of rows, indexed by `(degree // 30) * _ROW + level`.
+_ROW: int = _LVL.max + 1
+_SPECTRUM_FLAT: _t.List[_t.Sequence[Color] | _t.Mapping[int, Color]] = []
+_POINTS: _t.Dict[Bit8, _t.Tuple[HueLevel, int]] = {}
+# Each color's encoded `str()`, per ANSI code & background flag (_filled in as they're rendered_).
+_FG_BYTES: _t.List[_t.Optional[bytes]] = [None] * 256
+_BG_BYTES: _t.List[_t.Optional[bytes]] = [None] * 256
+
+##############################################################################
+# FUNCTIONS
+
+def rgb_to_xterm256(r: int, g: int, b: int) -> Bit8:
+  """Find the ANSI code (`16-255`) closest to a true-color value, in constant time.
+
+    Each channel is quantized independently to the 6-level color cube (_via a lookup table_), and the result is compared against the closest step of the greyscale ramp; whichever is nearer (_by squared distance_) wins.
+
+    Examples:
+      >>> rgb_to_xterm256(255, 0, 0)
+      196
+      >>> rgb_to_xterm256(130, 90, 200)
+      98
+      >>> rgb_to_xterm256(128, 128, 128)
+      244
+
+    Args:
+      r (int): The amount of red (`0-255`).
+      g (int): The amount of green (`0-255`).
+      b (int): The amount of blue (`0-255`).
+
+    Returns:
+      Bit8: The ANSI code of the nearest color.
+  """
+  r, g, b = int(Bit8(r)), int(Bit8(g)), int(Bit8(b))
+  # Nearest cube step of each channel.
+  qr, qg, qb = _CUBE_STEPS[r], _CUBE_STEPS[g], _CUBE_STEPS[b]
+  cr, cg, cb = int(_AMOUNTS[qr]), int(_AMOUNTS[qg]), int(_AMOUNTS[qb])
+  cube = 16 + 36 * qr + 6 * qg + qb
+  if cr == r and cg == g and cb == b:
+    return _ANSI_CODES[cube]
+  # Nearest step of the greyscale ramp.
+  avg  = (r + g + b) // 3
+  qs   = 23 if avg > 238 else max(0, (avg - 3) // 10)
+  cs   = 8 + 10 * qs
+  # ...
+  dc = (cr - r) ** 2 + (cg - g) ** 2 + (cb - b) ** 2
+  ds = (cs - r) ** 2 + (cs - g) ** 2 + (cs - b) ** 2
+  return _ANSI_CODES[232 + qs if ds < dc else cube]
+
+def _rgb_to_hsv(r: int, g: int, b: int) -> _t.Tuple[int, float, int]:
+  """Converts an RGB value to HSV, with the hue snapped to the nearest `30°` of the color wheel.
+
+    Shades have a hue of `0°`; pure reds sit at `360°`.
+
+    Examples:
+      >>> _rgb_to_hsv(255, 95, 0)
+      (30, 1.0, 255)
+      >>> _rgb_to_hsv(135, 135, 135)
+      (0, 0.0, 135)
+  """
+  mx = max(r, g, b)
+  d  = mx - min(r, g, b)
+  # ...
+  if not d:
+    return 0, 0.0, mx
+  # The sector of the wheel (_in 60° steps_) the hue falls on.
+  if r == mx:
+    h = (g - b) / d
+  elif g == mx:
+    h = 2.0 + (b - r) / d
+  else:
+    h = 4.0 + (r - g) / d
+  # ...
+  return (30 * round(h * 2) % 360) or 360, d / mx, mx
+
+def _rgb_to_lab(r: int, g: int, b: int) -> _t.Tuple[float, float, float]:
+  """Converts an sRGB value to the CIELAB color space (_D65 white-point_).
+  """
+  def f(t: float) -> float:
+    return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+  # ...
+  R, G, B = _LINEAR[r], _LINEAR[g], _LINEAR[b]
+  x = f((0.4124 * R + 0.3576 * G + 0.1805 * B) / 0.95047)
+  y = f((0.2126 * R + 0.7152 * G + 0.0722 * B))
+  z = f((0.0193 * R + 0.1192 * G + 0.9505 * B) / 1.08883)
+  return 116 * y - 16, 500 * (x - y), 200 * (y - z)
+
+def _build_spectrum_arrays() -> _t.Tuple[_t.Sequence[int | float], ...]:
+  """Computes the RGB & HSV columns of every ANSI code (`0-255`) in a single pass.
+
+    Returns:
+      tuple: The `R`, `G`, `B`, `H`, `S` & `V` columns, each indexed by ANSI code. 8-bit columns are packed as `bytes`, the rest as `array`s.
+  """
+  from array import array
+  from itertools import product
+  # The system colors, the 6x6x6 color cube, then the greyscale ramp.
+  R, G, B = zip(
+    *_SYSTEM,
+    *product((0, *range(95, 256, 40)), repeat=3),
+    *((s, s, s) for s in range(8, 239, 10)),
+  )
+  # Convert a whole column at a time.
+  H, S, V = zip(*map(_rgb_to_hsv, R, G, B))
+  # ...
+  return bytes(R), bytes(G), bytes(B), array('H', H), array('d', S), bytes(V)
+
+_R, _G, _B, _H, _S, _V = _build_spectrum_arrays()
+_ANSI_CODES: _t.Tuple[Bit8, ...] = tuple(map(Bit8._raw, range(256)))
+_RGB_MODELS: _t.Tuple[Color.RGBModel, ...] = tuple(map(Color.RGBModel._raw, _R, _G, _B))
+_HSV_MODELS: _t.Tuple[Color.HSVModel, ...] = tuple(map(Color.HSVModel._raw, _H, _S, _V))
+_WHEEL_OF: bytes = bytes((H // 30 - 1) % len(_WHEEL) for H in _H)
+# A color's hash only depends on its ANSI code & background flag.
+_FG_HASHES: _t.Tuple[int, ...] = tuple(
+  hash((*models, False)) for models in zip(_ANSI_CODES, _RGB_MODELS, _HSV_MODELS)
+)
+_BG_HASHES: _t.Tuple[int, ...] = tuple(
+  hash((*models, True)) for models in zip(_ANSI_CODES, _RGB_MODELS, _HSV_MODELS)
+)
+_XTERM_LAB: _t.Tuple[_t.Tuple[float, float, float], ...] = tuple(
+  _rgb_to_lab(*rgb) for rgb in zip(_R, _G, _B)
+)
 
 ##############################################################################
 # CLASSES
@@ -728,14 +859,36 @@ class _HueInterface:
 
   @property
   def Degree(self) -> DegUnit:
-    """The degree the hue falls within the color-wheel."""
+    """The degree the hue falls within the color-wheel. Changing it makes the hue take on another's colors.
+
+      Examples:
+        >>> _ = str(Red)
+        >>> Red.Degree = 210
+        >>> Red.Name
+        'Cyan'
+        >>> Red(1).ANSI
+        24
+        >>> print(f'{Red:hello, world}')
+        \033[38;5;27mhello, world\033[0m
+        >>> 'Cyan(y=level,x=saturation)' in str(Red)
+        True
+        >>> Red.Degree = 360
+    """
     return self._degree
   @Degree.setter
   def Degree(self, value: DegUnit) -> DegUnit:
     try:
       self._degree = value
       self._amounts: _t.Dict[Bit8, _t.List[Color]] = _SPECTRUM[value]
+      # Levels the hue doesn't reach resolve to the next one up.
+      self._resolved_amount: _t.Dict[HueLevel, Bit8] = {
+        level: next(a for l,a in _AMOUNTS.items() if l >= level and a in self._amounts)
+        for level in _AMOUNTS
+      }
       self._name = _NAMES[value]
+      # The grid & default color follow the hue.
+      self._str_cache: _t.Optional[str] = None
+      self.SetDefault(self._level, self._saturation)
     except:
       pass
 
@@ -759,12 +912,24 @@ class _HueInterface:
         >>> print(f'{Green:hello, world}')
         \033[38;5;34mhello, world\033[0m
 
+        Levels the hue doesn't reach resolve to the next one up, even after its degree changes:
+        >>> Green.SetDefault(1)
+        >>> Green.Degree = 30
+        >>> print(f'{Green:hello, world}')
+        \033[38;5;94mhello, world\033[0m
+        >>> Green.Degree = 120
+        >>> Green.SetDefault(3)
+
       Args:
         level (HueLevel, optional): The amount of pigment in the color, from `1` (darkest) to `5` (brightest). Defaults to 5.
         saturation (SatLevel, optional): The intensity of the color, from `1` (dull) to `9` (vivid). Defaults to 9.
     """
+    # Resolve the color up front, so formatting is a single lookup.
+    default = self._amounts[self._resolved_amount[level]][_SAT.max-saturation]
+    # ...
     self._level = level
     self._saturation = saturation
+    self._cached_default: Color = default
 
   #################################################
 
@@ -779,22 +944,21 @@ class _HueInterface:
       Returns:
         Color: The specified color.
     """
-    amount = _AMOUNTS[level]
-    # ...
-    while amount not in self._amounts:
-      level += 1;
-      amount = _AMOUNTS[level]
+    amount = self._resolved_amount[level]
     # ...
-    color = Color(self._amounts[amount][_SAT.max-saturation])
-    color.Background = bg
+    color = self._amounts[amount][_SAT.max-saturation].__copy__()
+    color._bg = bool(bg)
     # ...
     return color
 
   def __default__(self) -> Color:
-    V, S = self._level, (_SAT.max - self._saturation)
-    return self._amounts[_AMOUNTS[V]][S]
+    return self._cached_default
 
   def __str__(self) -> str:
+    # The grid never changes, so only render it once.
+    if self._str_cache:
+      return self._str_cache
+    # ...
     amounts = self._amounts
     purest  = amounts[255][0]
     result  = [f'{purest:{self.Name}(y=level,x=saturation)}','\n\n']
@@ -806,16 +970,17 @@ class _HueInterface:
     result.append('\n')
     # ...
     for amount, colors in sorted(amounts.items(), key=lambda r: r[0], reverse=True):
-      level = f'({_LEVELS[amount]})'
+      level = f'({_LEVEL_OF[amount]})'
       result.append(f'{purest:{level:<4}}')
       for color in colors:
         result.append(f'{color:{color.ANSI:>3}} ')
       result.append('\n')
     # ...
-    return ''.join(result)
+    self._str_cache = ''.join(result)
+    return self._str_cache
 
   def __format__(self, __format_spec: object) -> str:
-    return f'{self.__default__():{__format_spec}}'
+    return self._cached_default.__format__(__format_spec)
 
   #################################################
 
@@ -860,7 +1025,9 @@ class _HueType(_HueInterface, type):
 
   def __new__(typ, name: HueName, bases: tuple, dct: dict):
     cls = super().__new__(typ, name, bases, dct)
-    cls.Degree = _DEGREES[name]
+    # A hue's place in `_HUE_NAMES` is its degree, in steps of 30°.
+    idx = _HUE_NAMES.index(name)
+    cls.Degree = DegUnit._raw(idx * 30)
     return cls
 
 # A ghost-protocol (lol) that triggers intellisense and (hopefully) pydoc.
@@ -879,76 +1046,102 @@ class _HueProtocol:
     """
     ...
 
+def _build_spectrum() -> _t.Dict[DegUnit, _t.Dict[Bit8, _t.List[Color]]]:
+  """Organizes every color by hue > brightness > saturation.
+
+    Returns:
+      dict: The color database.
+  """
+  spectrum: _t.Dict[DegUnit, _t.Dict[Bit8, _t.List[Color]]] = {}
+  _shades: list[Color] = []
+  # Organize the spectrum by hue > brightness > saturation, straight from the precomputed columns.
+  for ansi in range(16, 255):
+    _H, _S, _V = _HSV_MODELS[ansi]
+    # ...
+    if _V and _V in _LEVELS:
+      spectrum.setdefault(_H, {}).setdefault(_V, []).append(Color(ansi))
+    else:
+      _shades.append(Color(ansi))
+  # Handle Shades: bucket each one under the nearest level above it, in a single pass.
+  thresholds = sorted(_LEVELS.keys(), reverse=True)
+  bounds = list(zip(thresholds, thresholds[1:]))
+  buckets: _t.Dict[Bit8, _t.List[Color]] = {a: [] for a, _ in bounds}
+  for shade in _shades:
+    C = shade.HSV.V + 40
+    for a, b in bounds:
+      if b < C < a:
+        buckets[a].append(shade)
+        break
+  # Shades go first (darkest to brightest), then the level's own greys, brightest first.
+  for a, bucket in buckets.items():
+    bucket.sort(key=lambda c: c.HSV.V)
+    spectrum[0][a] = bucket + spectrum[0][a][::-1]
+  # Fill in empty saturations.
+  for _H, _rankings in spectrum.items():
+    for _V, _colors in _rankings.items():
+      # ...
+      _colors = sorted(_colors, key=lambda c: c.HSV.S, reverse=True)
+      # ...
+      spectrum[_H][_V] = _colors + (_colors[-1:]*(_SAT.max-len(_colors)))
+  # ...
+  return spectrum
+
+def _load_spectrum(layout: _t.Dict[int, _t.Dict[int, _t.Sequence[int]]]) -> _t.Dict[DegUnit, _t.Dict[Bit8, _t.List[Color]]]:
+  """Wraps a pre-built layout of ANSI codes into the color database.
+
+    Args:
+      layout (dict): The ANSI codes of each hue > brightness > saturation.
+
+    Returns:
+      dict: The color database.
+  """
+  # Every ANSI code maps to a single, shared color.
+  colors: _t.Dict[int, Color] = {}
+  return {
+    DegUnit._raw(_H): {
+      Bit8._raw(_V): [colors.setdefault(ansi, Color(ansi)) for ansi in _codes]
+      for _V, _codes in _rankings.items()
+    }
+    for _H, _rankings in layout.items()
+  }
+
+# The pre-built color database ships alongside this module.
+try:
+  from ._spectrum_data import SPECTRUM as _SPECTRUM_PREBUILT
+  _SPECTRUM.update(_load_spectrum(_SPECTRUM_PREBUILT))
+except ImportError:
+  pass
+
 # The meta-type that ensures `Spectrum` is a static singleton.
 class _Spectrum(type):
 
   @staticmethod
   def __setup__():
-    """Initializes the color database.
+    """Initializes the color database, when it wasn't pre-built (_see `tools/generate_spectrum.py`_).
     """
-    global _SPECTRUM
     # Run once.
     if _SPECTRUM: return
     # ...
-    import os.path as _path, sys as _sys, pickle
-    from pathlib import Path
-    from functools import reduce
-    if getattr(_sys, 'frozen', False):
-      app_path = _sys._MEIPASS
-    else:
-      app_path = _path.dirname(_path.realpath(__file__))
-    # Determine cache version
-    tag = 'main' if __name__ == "__main__" else 'sub'
-    # Generate cache path.
-    dirc = Path(f'{app_path}/.store')
-    dirc.mkdir(parents=True, exist_ok=True)
-    path = dirc / f'spectrum.{tag}.p'
-    # Attempt to pull from the cache.
-    if path.exists() and _path.getmtime(path) > _path.getmtime(__file__):
-      try:
-        _SPECTRUM = pickle.load(open(path, 'rb'))
-        return
-      except:
-        pass
-    # Otherwise, create colors and update the cache, if needed.
-    _shades: list[Color] = []
-    _colors: list[Color] = [
-      color for color in
-      [Color(ansi) for ansi in range(16, 255)]
-    ]
-    # Organize the spectrum by hue > brightness > saturation.
-    for _color in _colors:
-      _H, _S, _V = _color.HSV
-      # ...
-      if _V and _V in _LEVELS:
-        if _H not in _SPECTRUM: _SPECTRUM[_H] = {}
-        if _V not in _SPECTRUM[_H]: _SPECTRUM[_H][_V] = []
-        # ...
-        _SPECTRUM[_H][_V].append(_color)
-      else:
-        _shades.append(_color)
-    # Handle Shades.
-    def reducer(a: Bit8, b: Bit8) -> Bit8:
-      def filterer(c: Color) -> bool:
-        C = c.HSV.V + 40
-        return C < a and C > b
-      S = list(filter(filterer, _shades))
-      S = sorted(S, key=lambda c: c.HSV.V, reverse=True)
-      _SPECTRUM[0][a] += S
-      _SPECTRUM[0][a] = list(reversed(_SPECTRUM[0][a]))
-      return b
-    reduce(reducer, sorted(_LEVELS.keys(), reverse=True))
-    # Fill in empty saturations.
+    _SPECTRUM.update(_build_spectrum())
+
+  @staticmethod
+  def __locate__():
+    """Indexes the level & saturation each color sits at within the database, and flattens it for lookups by hue & level.
+    """
+    for _rankings in _SPECTRUM.values():
+      for _V, _colors in _rankings.items():
+        for _S, _color in enumerate(_colors):
+          # Shades borrowed into another brightness aren't addressable.
+          if _color.HSV.V == _V:
+            _POINTS.setdefault(_color.ANSI, (_LEVEL_OF[_V], _S))
+    # Flatten the database; levels a hue doesn't reach are left empty (_as mappings, so they still raise `KeyError`_).
+    _SPECTRUM_FLAT[:] = [{}] * (len(_HUE_NAMES) * _ROW)
     for _H, _rankings in _SPECTRUM.items():
       for _V, _colors in _rankings.items():
-        # ...
-        _colors = sorted(_colors, key=lambda c: c.HSV.S, reverse=True)
-        # ...
-        _SPECTRUM[_H][_V] = _colors + (_colors[-1:]*(_SAT.max-len(_colors)))
-    # Save to cache
-    pickle.dump(_SPECTRUM, open(path, 'wb'))
+        _SPECTRUM_FLAT[_H // 30 * _ROW + _LEVEL_OF[_V]] = _colors
   # Initialize each hue.
   __setup__()
+  __locate__()
 
   def __call__(cls, *__args, **__kwargs):
     raise SyntaxError(f'{cls.__name__} is a static object and cannot be instantiated.')
@@ -957,12 +1150,19 @@ class _Spectrum(type):
     raise AttributeError(f'{cls.__name__} is a static object and cannot be assigned attributes.')
 
   def __str__(cls) -> str:
+    return cls._render()
+
+  # Each hue caches its own grid, so this only joins them.
+  def _render(cls) -> str:
     result = ['']
     hues = [_t.cast(_HueInterface, getattr(cls, hue)) for hue in _NAMES.values() if hasattr(cls, hue)]
     for hue in sorted(hues, key=lambda h: h.Degree, reverse=True): result.append(str(hue))
     result.append('')
     return '\n'.join(result)
 
+  def _render_bytes(cls) -> bytes:
+    return cls._render().encode()
+
 # The stars of the show.
 class Red(_HueProtocol, metaclass=_HueType): ...
 class Orange(_HueProtocol, metaclass=_HueType): ...
@@ -978,8 +1178,9 @@ class Magenta(_HueProtocol, metaclass=_HueType): ...
 class Rose(_HueProtocol, metaclass=_HueType): ...
 class Grey(_HueProtocol, metaclass=_HueType): ...
 
-White = Grey(5,1)
-Black = Grey(1,9)
+# Grey(5,1) & Grey(1,9), respectively, by their ANSI codes.
+White = Color(231)
+Black = Color(16)
 
 # Just a static collection of hues.
 class Spectrum(metaclass=_Spectrum):
@@ -1013,49 +1214,115 @@ class Spectrum(metaclass=_Spectrum):
   Grey = Grey
   """Grey and its variations (_see [**Grey**](#pyhues.Grey) for details_)."""
 
+  def Quantize(rgb: bytes) -> bytes:
+    """Map packed true-color pixels to the ANSI codes (`16-255`) nearest to them (_see `rgb_to_xterm256`_).
+
+      Examples:
+        >>> list(Spectrum.Quantize(bytes([255, 0, 0, 128, 128, 128, 255, 0, 0])))
+        [196, 244, 196]
+
+      Args:
+        rgb (bytes): Pixels, packed as consecutive red, green & blue bytes.
+
+      Raises:
+        ValueError: If `rgb` doesn't hold a whole number of pixels.
+
+      Returns:
+        bytes: One ANSI code per pixel.
+    """
+    if len(rgb) % 3:
+      raise ValueError(f'RGB data must hold a whole number of pixels (got {len(rgb)} bytes)')
+    # Each distinct pixel is only quantized once.
+    codes: _t.Dict[_t.Tuple[int, int, int], int] = {}
+    def code(pixel: _t.Tuple[int, int, int]) -> int:
+      try:
+        return codes[pixel]
+      except KeyError:
+        return codes.setdefault(pixel, rgb_to_xterm256(*pixel))
+    # ...
+    channels = iter(bytes(rgb))
+    return bytes(map(code, zip(channels, channels, channels)))
+
   def Kaleidoscope():
     """Have some fun with hues. Displays a looping marquee of a color spectrum:
       - Use <kbd>ctrl</kbd> + <kbd>c</kbd> to change the spectrum.
       - Use <kbd>ctrl</kbd> + <kbd>\\</kbd> (<kbd>ctrl</kbd> + <kbd>x</kbd>) to quit.
     """
-    from signal import signal, SIGQUIT, SIGINT
-    from random import randint as _randint, choice
-    from time import sleep as _sleep
-    global C
+    import os, selectors
+    from signal import signal, set_wakeup_fd, SIGQUIT, SIGINT
+    from random import randint as _randint, random
+    from time import monotonic
     # ...
     def change():
-      global C
-      try:
-        V = choice([v for v in LVL if v != C.HSV.V])
-        S = choice([s for s in SAT if s != C.HSV.S])
-        C = _SPECTRUM[C.HSV.H][V][S]
-      except KeyError:
-        change()
-    def quit(*_args):
+      nonlocal C
+      colors = CHOICES[C.HSV.H][C.HSV.V]
+      C = colors[int(random() * len(colors))]
+    def quit():
       _sys.exit(0)
-    def refresh(*_args):
-      print('\033[1000000000D', end='')
+    def refresh():
+      # Return to the start of the line, over the echoed `^C`.
+      os.write(out.fileno(), b'\r')
       change()
+    HANDLERS = { SIGQUIT: quit, SIGINT: refresh }
     # ...
-    signal(SIGQUIT, quit)
-    signal(SIGINT, refresh)
-    # ...
-    LVL = [ l for l in _LEVELS.keys() if l ]
-    SAT = [ *range(_SAT.max) ]
+    # Every color each hue can change to, flattened (_shades borrowed from another brightness can't be shifted_).
+    CHOICES: _t.Dict[DegUnit, _t.Dict[Bit8, _t.Tuple[Color, ...]]] = {}
+    for H, rankings in _SPECTRUM.items():
+      colors = tuple(color for V, colors in rankings.items() for color in colors if color.HSV.V == V)
+      # ...always at another brightness than the current one.
+      CHOICES[H] = {
+        V: tuple(color for color in colors if color.HSV.V != V)
+        for V in rankings
+      }
     C = Color(_randint(17,230))
+    # Render each color's line once, so frames are a single write.
+    out = _sys.stdout.buffer
+    ESC = [bytes(Color(ansi)) + b'\n' for ansi in range(256)]
+    # Each signal's number is written to a pipe, cutting the wait for the next frame short.
+    wake, alarm = os.pipe()
+    os.set_blocking(wake, False)
+    os.set_blocking(alarm, False)
+    wakeup = set_wakeup_fd(alarm)
+    selector = selectors.DefaultSelector()
+    selector.register(wake, selectors.EVENT_READ)
+    # Signals are handled by the loop, once they wake it up (_see below_).
+    previous = { signum: signal(signum, lambda *_args: None) for signum in HANDLERS }
     # ...
-
-    # ...
-    mn, mx = 1, 12
-    while True:
-      try:
-        C >>= 1
-        _sleep(.025)
-        print(C)
-      except KeyError:
-        change()
+    PERIOD = .025
+    start, frame = monotonic(), 0
+    try:
+      while True:
+        # Sleep until the next frame is due by the clock, or a signal arrives.
+        due = start + (frame + 1) * PERIOD
+        while (remaining := due - monotonic()) > 0:
+          if selector.select(remaining):
+            for signum in os.read(wake, 512):
+              # Other signals keep whatever handler they already had.
+              if handler := HANDLERS.get(signum):
+                handler()
+            break
+        # Advance by every frame that came due, but only draw the last (_same as `C >>= ticks`_).
+        ticks = max(1, int((monotonic() - start) / PERIOD) - frame)
+        frame += ticks
+        V, S = _POINTS[C._ansi]
+        colors = _SPECTRUM_FLAT[((_WHEEL_OF[C._ansi] + ticks) % len(_WHEEL) + 1)*_ROW + V]
+        # Change colors when the hue doesn't reach this brightness.
+        if not colors:
+          change()
+          continue
+        C = colors[S]
+        out.write(ESC[C._ansi])
+        out.flush()
+    finally:
+      # Leave the process as it was found (_e.g. when called from a REPL_).
+      for signum, handler in previous.items():
+        signal(signum, handler)
+      set_wakeup_fd(wakeup)
+      selector.close()
+      os.close(wake)
+      os.close(alarm)
 
 ##############################################################################
 
 if __name__ == "__main__":
-  print(f"{__title__} - {__doc__}")  # pragma: no cover
+  print(__doc__)  # pragma: no cover
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""The pre-built color database: the ANSI codes of each hue > brightness > saturation.
+
+Generated by `tools/generate_spectrum.py`; do not edit by hand.
+"""
+##############################################################################
+
+SPECTRUM = {
+  240: {
+     95: ( 17,  17,  17,  17,  17,  17,  17,  17,  17),
+    135: ( 18,  60,  60,  60,  60,  60,  60,  60,  60),
+    175: ( 19,  61, 103, 103, 103, 103, 103, 103, 103),
+    215: ( 20,  62, 104, 146, 146, 146, 146, 146, 146),
+    255: ( 21,  63,  69,  99, 105, 147, 189, 189, 189),
+  },
+  120: {
+     95: ( 22,  22,  22,  22,  22,  22,  22,  22,  22),
+    135: ( 28,  65,  65,  65,  65,  65,  65,  65,  65),
+    175: ( 34,  71, 108, 108, 108, 108, 108, 108, 108),
+    215: ( 40,  77, 114, 151, 151, 151, 151, 151, 151),
+    255: ( 46,  83,  84, 119, 120, 157, 194, 194, 194),
+  },
+  180: {
+     95: ( 23,  23,  23,  23,  23,  23,  23,  23,  23),
+    135: ( 30,  66,  66,  66,  66,  66,  66,  66,  66),
+    175: ( 31,  36,  37,  73, 109, 109, 109, 109, 109),
+    215: ( 38,  43,  44,  80, 116, 152, 152, 152, 152),
+    255: ( 45,  50,  51,  81,  86,  87, 123, 159, 195),
+  },
+  210: {
+    135: ( 24,  24,  24,  24,  24,  24,  24,  24,  24),
+    175: ( 25,  67,  67,  67,  67,  67,  67,  67,  67),
+    215: ( 26,  32,  68,  74, 110, 110, 110, 110, 110),
+    255: ( 27,  33,  39,  75, 111, 117, 153, 153, 153),
+  },
+  150: {
+    135: ( 29,  29,  29,  29,  29,  29,  29,  29,  29),
+    175: ( 35,  72,  72,  72,  72,  72,  72,  72,  72),
+    215: ( 41,  42,  78,  79, 115, 115, 115, 115, 115),
+    255: ( 47,  48,  49,  85, 121, 122, 158, 158, 158),
+  },
+  360: {
+     95: ( 52,  52,  52,  52,  52,  52,  52,  52,  52),
+    135: ( 88,  95,  95,  95,  95,  95,  95,  95,  95),
+    175: (124, 131, 138, 138, 138, 138, 138, 138, 138),
+    215: (160, 167, 174, 181, 181, 181, 181, 181, 181),
+    255: (196, 203, 204, 209, 210, 217, 224, 224, 224),
+  },
+  300: {
+     95: ( 53,  53,  53,  53,  53,  53,  53,  53,  53),
+    135: ( 90,  96,  96,  96,  96,  96,  96,  96,  96),
+    175: ( 91, 126, 127, 133, 139, 139, 139, 139, 139),
+    215: (128, 163, 164, 170, 176, 182, 182, 182, 182),
+    255: (165, 200, 201, 171, 206, 207, 213, 219, 225),
+  },
+  270: {
+    135: ( 54,  54,  54,  54,  54,  54,  54,  54,  54),
+    175: ( 55,  97,  97,  97,  97,  97,  97,  97,  97),
+    215: ( 56,  92,  98, 134, 140, 140, 140, 140, 140),
+    255: ( 57,  93, 129, 135, 141, 177, 183, 183, 183),
+  },
+  60: {
+     95: ( 58,  58,  58,  58,  58,  58,  58,  58,  58),
+    135: (100, 101, 101, 101, 101, 101, 101, 101, 101),
+    175: (106, 136, 142, 143, 144, 144, 144, 144, 144),
+    215: (148, 178, 184, 185, 186, 187, 187, 187, 187),
+    255: (190, 220, 226, 191, 221, 227, 228, 229, 230),
+  },
+  0: {
+     95: ( 16, 232, 233, 234, 235, 236,  59,  59,  59),
+    135: (237, 238, 239, 240, 102, 102, 102, 102, 102),
+    175: (241, 242, 243, 244, 145, 145, 145, 145, 145),
+    215: (245, 246, 247, 248, 188, 188, 188, 188, 188),
+    255: (249, 250, 251, 252, 231, 231, 231, 231, 231),
+  },
+  90: {
+    135: ( 64,  64,  64,  64,  64,  64,  64,  64,  64),
+    175: ( 70, 107, 107, 107, 107, 107, 107, 107, 107),
+    215: ( 76, 112, 113, 149, 150, 150, 150, 150, 150),
+    255: ( 82, 118, 154, 155, 156, 192, 193, 193, 193),
+  },
+  330: {
+    135: ( 89,  89,  89,  89,  89,  89,  89,  89,  89),
+    175: (125, 132, 132, 132, 132, 132, 132, 132, 132),
+    215: (161, 162, 168, 169, 175, 175, 175, 175, 175),
+    255: (197, 198, 199, 205, 211, 212, 218, 218, 218),
+  },
+  30: {
+    135: ( 94,  94,  94,  94,  94,  94,  94,  94,  94),
+    175: (130, 137, 137, 137, 137, 137, 137, 137, 137),
+    215: (166, 172, 173, 179, 180, 180, 180, 180, 180),
+    255: (202, 208, 214, 215, 216, 222, 223, 223, 223),
+  },
+}
+
+##############################################################################
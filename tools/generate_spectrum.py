@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Regenerates the pre-built color database (`src/pyrex/_spectrum_data.py`).
+
+Run this whenever the way the spectrum is organized changes:
+
+```bash
+python tools/generate_spectrum.py
+```
+"""
+##############################################################################
+# IMPORTS
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from pyrex.__source__ import _build_spectrum
+
+##############################################################################
+
+def main():
+  target = ROOT / 'src' / 'pyrex' / '_spectrum_data.py'
+  result = [
+    '#!/usr/bin/env python3',
+    '"""The pre-built color database: the ANSI codes of each hue > brightness > saturation.',
+    '',
+    'Generated by `tools/generate_spectrum.py`; do not edit by hand.',
+    '"""',
+    '##############################################################################',
+    '',
+    'SPECTRUM = {',
+  ]
+  for hue, rankings in _build_spectrum().items():
+    result.append(f'  {int(hue)}: {{')
+    for amount, colors in rankings.items():
+      codes = ', '.join(f'{int(color.ANSI):>3}' for color in colors)
+      result.append(f'    {int(amount):>3}: ({codes}),')
+    result.append('  },')
+  result += [
+    '}',
+    '',
+    '##############################################################################',
+    '',
+  ]
+  target.write_text('\n'.join(result))
+  print(f'Wrote {target.relative_to(ROOT)}')
+
+if __name__ == "__main__": main()
+
+##############################################################################